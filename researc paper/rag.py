@@ -1,8 +1,10 @@
 from dotenv import load_dotenv
 import os
+from collections import OrderedDict
 from langgraph.graph import StateGraph, END
 from typing import TypedDict, Annotated, Sequence
 from langchain_core.messages import BaseMessage, SystemMessage, HumanMessage, ToolMessage
+from langchain_core.documents import Document
 from operator import add as add_messages
 from langchain_openai import ChatOpenAI
 from langchain_openai import OpenAIEmbeddings
@@ -40,20 +42,81 @@ except Exception as e:
     raise
 
 # Chunking Process
-text_splitter = RecursiveCharacterTextSplitter(
-    chunk_size=1000,
-    chunk_overlap=200
-)
+# Prefer the Rust-backed splitter (pip install semantic-text-splitter), which runs the
+# same recursive separator cascade natively; fall back to LangChain's Python splitter
+try:
+    from semantic_text_splitter import TextSplitter
+
+    rust_splitter = TextSplitter(capacity=1000, overlap=200)
+
+    def split_documents(documents):
+        return [
+            Document(page_content=chunk, metadata={**doc.metadata, "start_index": start})
+            for doc in documents
+            for start, chunk in rust_splitter.chunk_indices(doc.page_content)
+        ]
+
+except ImportError:
+    text_splitter = RecursiveCharacterTextSplitter(
+        chunk_size=1000,
+        chunk_overlap=200,
+        add_start_index=True # merge_small_chunks uses the offsets to drop the overlap
+    )
+    split_documents = text_splitter.split_documents
+
+
+def merge_small_chunks(chunks, min_chunk_size=400, max_chunk_size=1150):
+    """Merge chunks shorter than min_chunk_size into their neighbour from the same source.
+
+    Short pages and page tails (headers, footers, closing lines) carry little context
+    but still cost an embedding and a DB row, so they are joined to the adjacent
+    chunk as long as the result stays under max_chunk_size (chunk_size * 1.15).
+
+    Neighbours on the same page share the splitter's overlap, which is dropped
+    using start_index so it isn't stored twice. A merge across pages keeps "page"
+    as the first page and sets "page_end" to the last one, so citations can give
+    the full range (Chroma metadata values must be scalars, so no page list).
+    """
+    merged = []
+    prev_end = None # End offset of merged[-1] within its last page
+    for chunk in chunks:
+        prev = merged[-1] if merged else None
+        start = chunk.metadata.get("start_index")
+        end = None if start is None else start + len(chunk.page_content)
+
+        if prev is None or prev.metadata.get("source") != chunk.metadata.get("source"):
+            merged.append(chunk)
+            prev_end = end
+            continue
+
+        same_page = prev.metadata.get("page_end", prev.metadata.get("page")) == chunk.metadata.get("page")
+        overlap = 0
+        if same_page and start is not None and prev_end is not None:
+            overlap = min(max(prev_end - start, 0), len(chunk.page_content))
+        text = chunk.page_content[overlap:]
+        separator = "" if overlap else "\n" # Without overlap the text picks up after trimmed whitespace
+
+        if (min(len(prev.page_content), len(chunk.page_content)) < min_chunk_size
+                and len(prev.page_content) + len(separator) + len(text) <= max_chunk_size):
+            prev.page_content = f"{prev.page_content}{separator}{text}"
+            if not same_page:
+                prev.metadata["page_end"] = chunk.metadata.get("page")
+        else:
+            merged.append(chunk)
+        prev_end = end
+    return merged
 
 
-pages_split = text_splitter.split_documents(pages) # We now apply this to our pages
+pages_split = split_documents(pages) # We now apply this to our pages
+chunk_count = len(pages_split)
+pages_split = merge_small_chunks(pages_split)
+print(f"Split into {len(pages_split)} chunks ({chunk_count} before merging small chunks)")
 
 persist_directory = r"C:\Vaibhav\LangGraph_Book\LangGraphCourse\Agents"
 collection_name = "stock_market"
 
 # If our collection does not exist in the directory, we create using the os command
-if not os.path.exists(persist_directory):
-    os.makedirs(persist_directory)
+os.makedirs(persist_directory, exist_ok=True)
 
 
 try:
@@ -77,22 +140,37 @@ retriever = vectorstore.as_retriever(
     search_kwargs={"k": 5} # K is the amount of chunks to return
 )
 
+# Repeated questions in a session skip the embedding call and the Chroma search.
+# Keyed on the normalized text, but the original query is what gets embedded.
+RETRIEVAL_CACHE_SIZE = 256
+retrieval_cache = OrderedDict()
+
+
+def cached_retrieve(query: str) -> tuple:
+    key = " ".join(query.lower().split())
+    if key in retrieval_cache:
+        retrieval_cache.move_to_end(key)  # mark as most recently used
+        return retrieval_cache[key]
+
+    docs = tuple(doc.page_content for doc in retriever.invoke(query))
+    retrieval_cache[key] = docs
+    if len(retrieval_cache) > RETRIEVAL_CACHE_SIZE:
+        retrieval_cache.popitem(last=False)  # evict the least recently used entry
+    return docs
+
+
 @tool
 def retriever_tool(query: str) -> str:
     """
     This tool searches and returns the information from the Stock Market Performance 2024 document.
     """
 
-    docs = retriever.invoke(query)
+    docs = cached_retrieve(query)
 
     if not docs:
         return "I found no relevant information in the Stock Market Performance 2024 document."
     
-    results = []
-    for i, doc in enumerate(docs):
-        results.append(f"Document {i+1}:\n{doc.page_content}")
-    
-    return "\n\n".join(results)
+    return "\n\n".join(f"Document {i+1}:\n{page_content}" for i, page_content in enumerate(docs))
 
 
 tools = [retriever_tool]
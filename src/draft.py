@@ -1,222 +0,0 @@
-from typing import Annotated, Sequence, TypedDict
-from dotenv import load_dotenv 
-from langchain_huggingface import ChatHuggingFace, HuggingFaceEndpoint 
-from langchain_core.messages import BaseMessage, HumanMessage, AIMessage, ToolMessage, SystemMessage
-from langchain_openai import ChatOpenAI
-from langchain_core.tools import tool
-from langgraph.graph.message import add_messages
-from langgraph.graph import StateGraph, END
-from langgraph.prebuilt import ToolNode
-
-load_dotenv()
-
-llm = HuggingFaceEndpoint(
-    repo_id="mistralai/Mistral-7B-Instruct-v0.2",  # Changed to another chat-compatible model
-    task="text-generation",
-)
-
-
-
-document_content = ""
-
-class AgentState(TypedDict):
-    messages: Annotated[Sequence[BaseMessage], add_messages]
-
-
-@tool
-def update(content: str) -> str:
-    """Updates the document with the provided content."""
-    global document_content
-    document_content = content
-    return f"Document has been updated successfully! The current content is:\n{document_content}"
-
-
-@tool
-def save(filename: str) -> str:
-    """Save the current document to a text file and finish the process.
-    
-    Args:
-        filename: Name for the text file.
-    """
-
-    global document_content
-
-    if not filename.endswith('.txt'):
-        filename = f"{filename}.txt"
-
-
-    try:
-        with open(filename, 'w') as file:
-            file.write(document_content)
-        print(f"\n💾 Document has been saved to: {filename}")
-        return f"Document has been saved successfully to '{filename}'."
-    
-    except Exception as e:
-        return f"Error saving document: {str(e)}"
-    
-
-tools = [update, save]
-
-model = ChatHuggingFace(llm=llm).bind_tools(tools)
-
-
-def our_agent(state: AgentState) -> AgentState:
-    system_prompt = SystemMessage(content=f"""
-    You are Drafter, a helpful writing assistant. You are going to help the user update and modify documents.
-    
-    - If the user wants to update or modify content, use the 'update' tool with the complete updated content.
-    - If the user wants to save and finish, you need to use the 'save' tool.
-    - Make sure to always show the current document state after modifications.
-    
-    The current document content is:{document_content}
-    """)
-
-    if not state["messages"]:
-        user_input = "I'm ready to help you update a document. What would you like to create?"
-        user_message = HumanMessage(content=user_input)
-
-    else:
-        user_input = input("\nWhat would you like to do with the document? ")
-        print(f"\n👤 USER: {user_input}")
-        user_message = HumanMessage(content=user_input)
-
-    all_messages = [system_prompt] + list(state["messages"]) + [user_message]
-
-    response = model.invoke(all_messages)
-
-    print(f"\n🤖 AI: {response.content}")
-    if hasattr(response, "tool_calls") and response.tool_calls:
-        print(f"🔧 USING TOOLS: {[tc['name'] for tc in response.tool_calls]}")
-
-    return {"messages": list(state["messages"]) + [user_message, response]}
-
-
-def should_continue(state: AgentState) -> str:
-    """Determine if we should continue or end the conversation."""
-
-    messages = state["messages"]
-    
-    if not messages:
-        return "continue"
-    
-   
-    for message in reversed(messages):
-       
-        if (isinstance(message, ToolMessage) and 
-            "saved" in message.content.lower() and
-            "document" in message.content.lower()):
-            return "end" # goes to the end edge which leads to the endpoint
-        
-    return "continue"
-
-def print_messages(messages):
-    """Function to print the messages in a more readable format"""
-    if not messages:
-        return
-    
-    for message in messages[-3:]:
-        if isinstance(message, ToolMessage):
-            print(f"\n🛠️ TOOL RESULT: {message.content}")
-
-
-graph = StateGraph(AgentState)
-
-graph.add_node("agent", our_agent)
-graph.add_node("tools", ToolNode(tools))
-
-graph.set_entry_point("agent")
-
-graph.add_edge("agent", "tools")
-
-
-graph.add_conditional_edges(
-    "tools",
-    should_continue,
-    {
-        "continue": "agent",
-        "end": END,
-    },
-)
-
-app = graph.compile()
-
-def run_document_agent(initial_input=None, callback=None):
-    print("\n ===== DRAFTER =====")
-    
-    state = {"messages": []}
-    
-    # If there's an initial input from the GUI
-    if initial_input:
-        user_message = HumanMessage(content=initial_input)
-        system_prompt = SystemMessage(content=f"""
-        You are Drafter, a helpful writing assistant. You are going to help the user update and modify documents.
-        
-        - If the user wants to update or modify content, use the 'update' tool with the complete updated content.
-        - If the user wants to save and finish, you need to use the 'save' tool.
-        - Make sure to always show the current document state after modifications.
-        
-        The current document content is:{document_content}
-        """)
-        
-        messages = [system_prompt, user_message]
-        response = model.invoke(messages)
-        state["messages"] = [user_message, response]
-        
-        if callback:
-            callback(response.content)
-            
-            if hasattr(response, "tool_calls") and response.tool_calls:
-                tool_names = [tc['name'] for tc in response.tool_calls]
-                callback(f"🔧 USING TOOLS: {tool_names}")
-    
-    return app, state
-
-def process_user_input(user_input, state, callback=None):
-    """Process a single user input with the current state and return the updated state"""
-    user_message = HumanMessage(content=user_input)
-    
-    system_prompt = SystemMessage(content=f"""
-    You are Drafter, a helpful writing assistant. You are going to help the user update and modify documents.
-    
-    - If the user wants to update or modify content, use the 'update' tool with the complete updated content.
-    - If the user wants to save and finish, you need to use the 'save' tool.
-    - Make sure to always show the current document state after modifications.
-    
-    The current document content is:{document_content}
-    """)
-    
-    all_messages = [system_prompt] + list(state["messages"]) + [user_message]
-    
-    response = model.invoke(all_messages)
-    
-    if callback:
-        callback(response.content)
-        
-        if hasattr(response, "tool_calls") and response.tool_calls:
-            tool_names = [tc['name'] for tc in response.tool_calls]
-            callback(f"🔧 USING TOOLS: {tool_names}")
-    
-    new_state = {"messages": list(state["messages"]) + [user_message, response]}
-    
-    # Process tool calls if any
-    if hasattr(response, "tool_calls") and response.tool_calls:
-        tool_responses = ToolNode(tools).invoke(new_state)
-        
-        # Check if we need to end the session
-        continue_or_end = should_continue(tool_responses)
-        if continue_or_end == "end":
-            if callback:
-                callback("\n ===== DRAFTER FINISHED =====")
-            return tool_responses, True  # True indicates we should end
-            
-        if callback and "messages" in tool_responses:
-            for message in tool_responses["messages"][-2:]:  # Show tool messages
-                if isinstance(message, ToolMessage):
-                    callback(f"🛠️ TOOL RESULT: {message.content}")
-        
-        return tool_responses, False
-    
-    return new_state, False
-
-if __name__ == "__main__":
-    run_document_agent()
\ No newline at end of file
@@ -0,0 +1,317 @@
+import os
+import hashlib
+from typing import Annotated, Sequence, TypedDict
+from dotenv import load_dotenv 
+from langchain_core.messages import BaseMessage, HumanMessage, AIMessage, SystemMessage
+from langchain_core.messages.utils import count_tokens_approximately, trim_messages
+from langchain_core.tools import tool
+from langgraph.graph.message import add_messages
+from langgraph.graph import StateGraph, END
+from langgraph.prebuilt import ToolNode
+from drafter.models import MAX_PROMPT_TOKENS, get_llm_model
+
+load_dotenv()
+
+llm = get_llm_model()
+
+
+
+document_content = ""
+
+# (filename, blake2b digest) of the last successful save, to skip rewriting unchanged documents
+_last_saved = None
+
+class AgentState(TypedDict):
+    messages: Annotated[Sequence[BaseMessage], add_messages]
+
+
+@tool
+def update(content: str) -> str:
+    """Updates the document with the provided content."""
+    global document_content
+    document_content = content
+    return f"Document has been updated successfully! The current content is:\n{document_content}"
+
+
+@tool
+def save(filename: str) -> str:
+    """Save the current document to a text file and finish the process.
+    
+    Args:
+        filename: Name for the text file.
+    """
+
+    global document_content, _last_saved
+
+    if os.path.splitext(filename)[1].lower() != '.txt':
+        filename = f"{filename}.txt"
+
+
+    try:
+        # Encode once and write the bytes straight to the fd, skipping the text layer
+        data = document_content.encode("utf-8")
+        saved = (filename, hashlib.blake2b(data).digest())
+
+        if saved != _last_saved or not os.path.exists(filename):
+            fd = os.open(filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(fd, view):]
+            finally:
+                os.close(fd)
+            _last_saved = saved
+
+        print(f"\n💾 Document has been saved to: {filename}")
+        return f"Document has been saved successfully to '{filename}'."
+    
+    except Exception as e:
+        return f"Error saving document: {str(e)}"
+    
+
+tools = [update, save]
+
+model = llm.bind_tools(tools)
+
+# Built once and shared by the graph and process_user_input
+tool_node = ToolNode(tools)
+
+
+STATIC_SYSTEM_PROMPT = """
+    You are Drafter, a helpful writing assistant. You are going to help the user update and modify documents.
+    
+    - If the user wants to update or modify content, use the 'update' tool with the complete updated content.
+    - If the user wants to save and finish, you need to use the 'save' tool.
+    - Make sure to always show the current document state after modifications.
+    
+    The current document content is given at the end of the latest user message, inside <document> tags.
+    """
+
+
+def get_system_prompt() -> SystemMessage:
+    """Build the system prompt shared by every entry point.
+
+    The prompt never changes, so a prefix-caching backend (vLLM
+    --enable-prefix-caching) can reuse the KV cache for it and for the
+    unchanged conversation history. The document is sent via document_context_message.
+    """
+    return SystemMessage(content=STATIC_SYSTEM_PROMPT)
+
+
+def document_context_message(doc: str, user_input: str) -> HumanMessage:
+    """Attach the current document to the newest user turn.
+
+    Only this final message changes between turns. It is sent to the model but
+    not stored in the state, so the history prefix stays identical. Merging into
+    the user turn (rather than a separate message) keeps user/assistant roles
+    alternating for chat templates that require it.
+    """
+    return HumanMessage(content=f"{user_input}\n\n<document>{doc}</document>")
+
+
+def trim_history(messages, max_tokens):
+    """Keep only the most recent turns that fit in max_tokens.
+
+    The window always starts on a user message, so tool results are never
+    separated from the AI message that called them. If even the latest turn is
+    over budget (e.g. one large update call), its user message is kept on its
+    own when that fits, so the model still sees the last request.
+
+    Trade-off: while the history fits, each prompt extends the previous one and
+    the server's prefix cache is reused. Once the window starts sliding, the
+    oldest turns drop off the front, so only the system prompt stays cached.
+    """
+    if max_tokens <= 0:
+        return []
+
+    messages = list(messages)
+    trimmed = trim_messages(
+        messages,
+        max_tokens=max_tokens,
+        strategy="last",
+        token_counter=count_tokens_approximately,
+        start_on="human",
+    )
+    if trimmed or not messages:
+        return trimmed
+
+    for message in reversed(messages):
+        if message.type == "human":
+            return [message] if count_tokens_approximately([message]) <= max_tokens else []
+    return []
+
+
+def our_agent(state: AgentState) -> AgentState:
+    if not state["messages"]:
+        user_input = "I'm ready to help you update a document. What would you like to create?"
+        user_message = HumanMessage(content=user_input)
+
+    else:
+        user_input = input("\nWhat would you like to do with the document? ")
+        print(f"\n👤 USER: {user_input}")
+        user_message = HumanMessage(content=user_input)
+
+    response = model.invoke(build_turn_messages(user_message, state))
+
+    print(f"\n🤖 AI: {response.content}")
+    tool_calls = getattr(response, "tool_calls", None)
+    if tool_calls:
+        print(f"🔧 USING TOOLS: {[tc['name'] for tc in tool_calls]}")
+
+    return {"messages": list(state["messages"]) + [user_message, response]}
+
+
+def should_continue(state: AgentState) -> str:
+    """Determine if we should continue or end the conversation."""
+
+    messages = state["messages"]
+    
+    # Only the tool results at the end come from the step that just ran, so
+    # stop at the first non-tool message instead of scanning the whole history
+    for message in reversed(messages):
+        if message.type != "tool":
+            break
+        content = message.content.lower()
+        if "saved" in content and "document" in content:
+            return "end" # goes to the end edge which leads to the endpoint
+        
+    return "continue"
+
+def print_messages(messages):
+    """Function to print the messages in a more readable format"""
+    if not messages:
+        return
+    
+    # Index the tail directly: no slice copy, and O(1) for lists and deques alike
+    for i in range(max(0, len(messages) - 3), len(messages)):
+        message = messages[i]
+        if message.type == "tool":
+            print(f"\n🛠️ TOOL RESULT: {message.content}")
+
+
+graph = StateGraph(AgentState)
+
+graph.add_node("agent", our_agent)
+graph.add_node("tools", tool_node)
+
+graph.set_entry_point("agent")
+
+graph.add_edge("agent", "tools")
+
+
+graph.add_conditional_edges(
+    "tools",
+    should_continue,
+    {
+        "continue": "agent",
+        "end": END,
+    },
+)
+
+app = graph.compile()
+
+def run_document_agent(initial_input=None, callback=None):
+    print("\n ===== DRAFTER =====")
+    
+    state = {"messages": []}
+    
+    # If there's an initial input from the GUI
+    if initial_input:
+        user_message = HumanMessage(content=initial_input)
+        system_prompt = get_system_prompt()
+        
+        messages = [system_prompt, document_context_message(document_content, user_message.content)]
+        response = model.invoke(messages)
+        state["messages"] = [user_message, response]
+        
+        if callback:
+            callback(response.content)
+            
+            tool_calls = getattr(response, "tool_calls", None)
+            if tool_calls:
+                tool_names = [tc['name'] for tc in tool_calls]
+                callback(f"🔧 USING TOOLS: {tool_names}")
+    
+    return app, state
+
+def stream_model(messages, on_token):
+    """Stream the model response, calling on_token with the text generated so far.
+
+    Chunks are merged as they arrive, so tool-call deltas are accumulated and the
+    returned message exposes the complete tool_calls once the stream finishes.
+    """
+    response = None
+    for chunk in model.stream(messages):
+        response = chunk if response is None else response + chunk
+        if chunk.content:
+            on_token(response.content)
+    return response if response is not None else AIMessage(content="")
+
+def build_turn_messages(user_message, state):
+    """Assemble the prompt for one turn: system prompt, trimmed history, then the new user turn.
+
+    The system prompt and the document message are always sent whole, so the
+    history gets whatever is left of MAX_PROMPT_TOKENS after them.
+    """
+    system_prompt = get_system_prompt()
+    current = document_context_message(document_content, user_message.content)
+    history_budget = MAX_PROMPT_TOKENS - count_tokens_approximately([system_prompt, current])
+    return [system_prompt] + trim_history(state["messages"], history_budget) + [current]
+
+def finish_turn(user_message, response, state, callback=None):
+    """Report the model response, run any tool calls and return (new_state, should_end)"""
+    tool_calls = getattr(response, "tool_calls", None)
+    
+    if callback:
+        callback(response.content)
+        
+        if tool_calls:
+            tool_names = [tc['name'] for tc in tool_calls]
+            callback(f"🔧 USING TOOLS: {tool_names}")
+    
+    new_state = {"messages": list(state["messages"]) + [user_message, response]}
+    
+    # Process tool calls if any
+    if tool_calls:
+        tool_responses = tool_node.invoke(new_state)
+        
+        # Check if we need to end the session
+        continue_or_end = should_continue(tool_responses)
+        if continue_or_end == "end":
+            if callback:
+                callback("\n ===== DRAFTER FINISHED =====")
+            return tool_responses, True  # True indicates we should end
+            
+        if callback and "messages" in tool_responses:
+            for message in tool_responses["messages"][-2:]:  # Show tool messages
+                if message.type == "tool":
+                    callback(f"🛠️ TOOL RESULT: {message.content}")
+        
+        return tool_responses, False
+    
+    return new_state, False
+
+def process_user_input(user_input, state, callback=None, on_token=None):
+    """Process a single user input with the current state and return the updated state
+
+    If on_token is given the response is streamed and on_token receives the
+    partial text as it is generated.
+    """
+    user_message = HumanMessage(content=user_input)
+    all_messages = build_turn_messages(user_message, state)
+    
+    if on_token:
+        response = stream_model(all_messages, on_token)
+    else:
+        response = model.invoke(all_messages)
+    
+    return finish_turn(user_message, response, state, callback)
+
+async def aprocess_user_input(user_input, state, callback=None):
+    """Async version of process_user_input; awaits the model instead of blocking a thread"""
+    user_message = HumanMessage(content=user_input)
+    response = await model.ainvoke(build_turn_messages(user_message, state))
+    return finish_turn(user_message, response, state, callback)
+
+if __name__ == "__main__":
+    run_document_agent()
\ No newline at end of file
@@ -1,12 +1,16 @@
 import tkinter as tk
 from tkinter import scrolledtext, messagebox, simpledialog
 import threading
-import sys
-import os
+import asyncio
 
-# Add the parent directory to the path so we can import draft
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from src.draft import run_document_agent, process_user_input
+from drafter.draft import run_document_agent, aprocess_user_input
+
+# Text and tag inserted before a message, per sender
+SENDER_PREFIXES = {
+    "user": ("\n👤 YOU: ", "user_tag"),
+    "bot": ("\n", "bot_tag"),
+    "tool": ("\n", "tool_tag"),
+}
 
 class DrafterGUI:
     def __init__(self, root):
@@ -58,18 +62,19 @@ class DrafterGUI:
         
         # Processing flag
         self.processing = False
+        
+        # One event loop in a background thread runs all agent calls
+        self.loop = asyncio.new_event_loop()
+        threading.Thread(target=self.loop.run_forever, daemon=True).start()
 
     def display_message(self, message, sender):
         """Display a message in the chat display"""
         self.chat_display.config(state=tk.NORMAL)
         
         # Add appropriate icon based on sender
-        if sender == "user":
-            self.chat_display.insert(tk.END, "\n👤 YOU: ", "user_tag")
-        elif sender == "bot":
-            self.chat_display.insert(tk.END, "\n", "bot_tag")
-        elif sender == "tool":
-            self.chat_display.insert(tk.END, "\n", "tool_tag")
+        prefix = SENDER_PREFIXES.get(sender)
+        if prefix:
+            self.chat_display.insert(tk.END, *prefix)
         
         # Insert the actual message
         self.chat_display.insert(tk.END, f"{message}\n")
@@ -99,17 +104,17 @@ class DrafterGUI:
         self.status_var.set("Processing...")
         self.send_button.config(state=tk.DISABLED)
         
-        # Process in a separate thread to keep GUI responsive
-        threading.Thread(target=self.process_input, args=(user_input,), daemon=True).start()
+        # Process on the background event loop to keep GUI responsive
+        asyncio.run_coroutine_threadsafe(self._process_async(user_input), self.loop)
         
         # Prevent default behavior if called from an event
         return "break"
     
-    def process_input(self, user_input):
-        """Process the user input in a separate thread"""
+    async def _process_async(self, user_input):
+        """Process the user input on the background event loop"""
         try:
             # Process the user input
-            new_state, should_end = process_user_input(
+            new_state, should_end = await aprocess_user_input(
                 user_input, 
                 self.state, 
                 lambda msg: self.root.after(0, lambda: self.display_message(msg, "bot"))
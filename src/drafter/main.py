@@ -0,0 +1,35 @@
+import argparse
+import os
+import sys
+
+
+def run_web(streamlit_args=()):
+    """Start the Streamlit app in this process instead of shelling out to `streamlit run`"""
+    from streamlit.web import cli as stcli
+
+    app_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "streamlit_interface.py")
+    sys.argv = ["streamlit", "run", app_path, *streamlit_args]
+    sys.exit(stcli.main())
+
+
+def run_gui():
+    from drafter.interface import main as gui_main
+
+    gui_main()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Drafter - AI Writing Assistant")
+    parser.add_argument("--mode", choices=["web", "gui"], default="web",
+                        help="web: Streamlit interface, gui: desktop (tkinter) interface")
+    # Anything else (e.g. --server.port 8080) is passed through to Streamlit
+    args, streamlit_args = parser.parse_known_args()
+
+    if args.mode == "gui":
+        run_gui()
+    else:
+        run_web(streamlit_args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+import os
+from functools import lru_cache
+from dotenv import load_dotenv
+
+load_dotenv()
+
+HF_REPO_ID = "mistralai/Mistral-7B-Instruct-v0.2"
+VLLM_MODEL = os.getenv("VLLM_MODEL", "TinyLlama/TinyLlama-1.1B-Chat-v1.0")
+
+# Token budget for a whole prompt (system prompt, history and document), leaving
+# room for the reply. The vLLM default fits TinyLlama's 2048-token context window,
+# so set MAX_PROMPT_TOKENS when VLLM_MODEL has a different one.
+MAX_PROMPT_TOKENS = int(os.getenv("MAX_PROMPT_TOKENS") or (1536 if os.getenv("VLLM_BASE_URL") else 3072))
+
+
+@lru_cache(maxsize=1)
+def get_llm_model():
+    """Return the chat model used by Drafter.
+
+    The model is built once per process and shared by every caller, so clients
+    keep their connection pools.
+
+    When VLLM_BASE_URL is set (e.g. http://localhost:8000/v1) the model is served
+    by vLLM through its OpenAI-compatible API, which gives PagedAttention,
+    continuous batching and prefix caching (and 4-bit weights when served with
+    --quantization bitsandbytes). Otherwise the hosted Hugging Face endpoint is used.
+    """
+    base_url = os.getenv("VLLM_BASE_URL")
+
+    # Backend packages are imported only for the branch in use; each one pulls in
+    # its own client stack, which is a large share of startup time
+    if base_url:
+        from langchain_openai import ChatOpenAI
+
+        return ChatOpenAI(
+            base_url=base_url,
+            api_key=os.getenv("VLLM_API_KEY", "EMPTY"),  # vLLM ignores the key unless --api-key is set
+            model=VLLM_MODEL,
+        )
+
+    from langchain_huggingface import ChatHuggingFace, HuggingFaceEndpoint
+
+    llm = HuggingFaceEndpoint(
+        repo_id=HF_REPO_ID,
+        task="text-generation",
+    )
+    return ChatHuggingFace(llm=llm)
@@ -0,0 +1,178 @@
+import streamlit as st
+from collections import deque
+from streamlit.errors import StreamlitAPIException
+
+try:
+    from drafter import draft
+except ImportError:
+    # `streamlit run src/drafter/streamlit_interface.py` from a checkout that
+    # hasn't been pip-installed: make the src/ directory importable
+    import os
+    import sys
+
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from drafter import draft
+from drafter.draft import run_document_agent, process_user_input
+
+# Bound the displayed chat history so long sessions don't grow without limit
+MAX_CHAT_HISTORY = 500
+
+# Avatar and markdown template for each chat role, looked up once per rendered message
+ROLE_AVATARS = {
+    "user": "👤",
+    "assistant": "🤖",
+    "tool": "🛠️",
+    "system": "🔧",
+}
+ROLE_TEMPLATES = {
+    "user": "{}",
+    "assistant": "{}",
+    "tool": "**{}**",
+    "system": "*{}*",
+}
+
+def init_session_state():
+    """Initialize all session state variables"""
+    # Initialize app and state if they don't exist
+    if 'initialized' not in st.session_state:
+        st.session_state.initialized = True
+        app, state = run_document_agent()
+        st.session_state.app = app
+        st.session_state.state = state
+    
+    # Initialize message history if it doesn't exist
+    if 'messages' not in st.session_state:
+        st.session_state.messages = deque(maxlen=MAX_CHAT_HISTORY)
+        # Add initial welcome message
+        st.session_state.messages.append({
+            "role": "assistant",
+            "content": "I'm ready to help you update a document. What would you like to create?"
+        })
+    
+    # Initialize processing flag if it doesn't exist
+    if 'processing' not in st.session_state:
+        st.session_state.processing = False
+
+def handle_message(content):
+    """Add assistant messages to the session state"""
+    if content.startswith("🛠️ TOOL RESULT:"):
+        st.session_state.messages.append({"role": "tool", "content": content})
+    elif content.startswith("🔧 USING TOOLS:"):
+        st.session_state.messages.append({"role": "system", "content": content})
+    else:
+        st.session_state.messages.append({"role": "assistant", "content": content})
+
+def process_input(user_input, stream_container):
+    """Process user input and update the UI"""
+    if user_input:
+        st.session_state.messages.append({"role": "user", "content": user_input})
+        st.session_state.clear_input = True
+        # Show the message right away and stream the response below it
+        stream_container.chat_message("user", avatar=ROLE_AVATARS["user"]).markdown(user_input)
+        response_placeholder = stream_container.chat_message("assistant", avatar=ROLE_AVATARS["assistant"]).empty()
+        previous_document = draft.document_content
+        new_state, should_end = process_user_input(
+            user_input, 
+            st.session_state.state,
+            handle_message,
+            on_token=response_placeholder.markdown
+        )
+        st.session_state.state = new_state
+        if should_end:
+            st.session_state.messages.append({
+                "role": "system", 
+                "content": "Document has been saved. You can start a new session."
+            })
+        # Rerun after response is appended. Only the chat fragment needs
+        # redrawing unless the document changed, in which case the preview is stale too.
+        if draft.document_content != previous_document or should_end:
+            st.rerun()
+        try:
+            st.rerun(scope="fragment")
+        except StreamlitAPIException:
+            # Not inside a fragment rerun (e.g. the first full run of the page)
+            st.rerun()
+
+def reset_session():
+    """Reset the session state for a new conversation"""
+    # Reset the app and state
+    app, state = run_document_agent()
+    st.session_state.app = app
+    st.session_state.state = state
+    # Reset messages
+    st.session_state.messages = deque([{
+        "role": "assistant",
+        "content": "I'm ready to help you update a document. What would you like to create?"
+    }], maxlen=MAX_CHAT_HISTORY)
+    # Reset processing flag
+    st.session_state.processing = False
+
+@st.fragment
+def chat_fragment():
+    """Chat history and input; reruns on its own so a turn doesn't redraw the whole page"""
+    # Chat interface section
+    st.subheader("Chat with Drafter")
+    
+    # Display chat messages
+    chat_container = st.container()
+    with chat_container:
+        for message in st.session_state.messages:
+            template = ROLE_TEMPLATES.get(message["role"])
+            if template:
+                with st.chat_message(message["role"], avatar=ROLE_AVATARS[message["role"]]):
+                    st.markdown(template.format(message["content"]))
+        stream_container = st.container()
+    
+    # Input area for new messages
+    # Generate a new key for the text area if we need to clear it
+    input_key = f"user_input_{len(st.session_state.messages)}" if st.session_state.get('clear_input', False) else "user_input"
+    
+    # Reset the clear flag
+    if st.session_state.get('clear_input', False):
+        st.session_state.clear_input = False
+        
+    user_input = st.text_area("Your message", height=100, key=input_key)
+    
+    # Submit button
+    col1, col2 = st.columns([4, 1])
+    with col2:
+        submit_button = st.button("Send", use_container_width=True)
+    
+    # Process the input when the button is clicked
+    if submit_button and user_input:
+        process_input(user_input, stream_container)
+        # No need to rerun here, handled in process_input
+
+def main():
+    st.set_page_config(
+        page_title="Drafter - AI Writing Assistant",
+        page_icon="📝",
+        layout="wide"
+    )
+    
+    st.title("📝 Drafter - AI Writing Assistant")
+    
+    # Initialize session state
+    init_session_state()
+
+    # Create two columns: chat and document previews
+    col1, col2 = st.columns([2, 1])
+    
+    with col2:
+        # Document preview section
+        st.subheader("Document Preview")
+        
+        # Preview the document content, read from the module so it's always current
+        preview = draft.document_content if draft.document_content else "No content yet"
+        st.text_area("Current Document", value=preview, height=400, disabled=True)
+        
+        # New session button
+        if st.button("New Session"):
+            reset_session()
+            st.rerun()
+    
+    with col1:
+        chat_fragment()
+
+if __name__ == "__main__":
+    main()